@@ -25,6 +25,8 @@ class Flag:
 
 
 class BitFlags:
+    __slots__ = ('_value',)
+
     def __init__(self, value: int = 0) -> None:
         self._value = value
 
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional, List, Generator, Any
 import asyncio
 
 from .base import BaseObject
+from .errors import MalformedPayload
 from .message import Message
 from .utils import pending, sanitize_id, call_later
 
@@ -53,8 +54,12 @@ class Channel(BaseObject):
     def _process_data(self, data: Optional[ChannelPayload], /) -> None:
         if not data:
             data: dict = {}
-
-        self._store_snowflake(data.get('id'))
+            self._store_snowflake(None)
+        else:
+            try:
+                self._store_snowflake(data['id'])
+            except KeyError:
+                raise MalformedPayload('Channel', 'id', data) from None
 
         self._name: Optional[str] = data.get('name')
 
@@ -102,7 +107,7 @@ class Channel(BaseObject):
         await self._connection.api.channels(self.id).typing.delete()
 
     @pending
-    async def type_for(self, seconds: int) -> asyncio.Task:
+    async def type_for(self, seconds: int) -> asyncio.TimerHandle:
         """|coro|
 
         Starts typing in this channel for a specified amount of time.
@@ -113,7 +118,7 @@ class Channel(BaseObject):
 
         Returns
         -------
-        asyncio.Task
+        asyncio.TimerHandle
         """
         await self._start_typing()
 
@@ -78,9 +78,6 @@ class Connection:
 
         self._messages: deque = deque(maxlen=self._max_messages_count)
 
-    def deref_user(self, id: Snowflake, /) -> None:
-        self._users.pop(id, None)
-
     def deref_channel(self, id: Snowflake, /) -> None:
         self._channels.pop(id, None)
 
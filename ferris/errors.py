@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from aiohttp import ClientResponse
 
@@ -14,6 +14,7 @@ __all__ = (
     'WebsocketException',
     'MissingImplementation',
     'Reconnect',
+    'MalformedPayload',
 )
 
 
@@ -100,3 +101,21 @@ class Reconnect(WebsocketException):
     """Signal to reconnect to the websocket."""
 
     pass
+
+
+class MalformedPayload(FerrisException):
+    """
+    FerrisChat sent a payload that is missing a required field.
+
+    Attributes
+    ----------
+    field: str
+        The name of the missing field.
+    data: dict
+        The payload that was received.
+    """
+
+    def __init__(self, name: str, field: str, data: Dict[str, Any]):
+        self.field = field
+        self.data = data
+        super().__init__(f'{name} payload is missing required field {field!r}')
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 from ferris.role import Role
@@ -8,6 +9,7 @@ from .base import BaseObject
 from .asset import Asset
 from .bitflags import GuildFlags
 from .channel import Channel
+from .errors import MalformedPayload
 from .invite import Invite
 from .role import Role
 from .utils import sanitize_id
@@ -43,11 +45,15 @@ class Guild(BaseObject):
     def _process_data(self, data: Optional[GuildPayload], /) -> None:
         if not data:
             data: dict = {}
+            self._store_snowflake(None)
+        else:
+            try:
+                self._store_snowflake(data['id'])
+            except KeyError:
+                raise MalformedPayload('Guild', 'id', data) from None
 
         from .member import Member
 
-        self._store_snowflake(data.get('id'))
-
         self._owner_id: Optional[Snowflake] = data.get('owner_id')
 
         if icon := data.get('icon'):
@@ -58,11 +64,10 @@ class Guild(BaseObject):
         self._name: Optional[str] = data.get('name')
 
         self._channels: Dict[Snowflake, Channel] = {}
-        self._roles: Dict[Snowflake, Role] = {}
 
         self._flags: GuildFlags = GuildFlags(data.get('flags') or 0)
 
-        for c in data.get('channels') or []:
+        for c in data.get('channels') or ():
             if channel := self._connection.get_channel(c.get('id')):
                 channel._process_data(c)
             else:
@@ -70,15 +75,11 @@ class Guild(BaseObject):
             self._channels[channel.id] = channel
             self._connection.store_channel(channel)
 
-        self._members: Dict[Snowflake, Member] = {}
+        members = map(partial(Member, self._connection), data.get('members') or ())
+        self._members: Dict[Snowflake, Member] = {m.id: m for m in members}
 
-        for m in data.get('members') or []:
-            member = Member(self._connection, m)
-            self._members[member.id] = member
-
-        for r in data.get('roles') or []:
-            role = Role(self._connection, r)
-            self._roles[role.id] = role
+        roles = map(partial(Role, self._connection), data.get('roles') or ())
+        self._roles: Dict[Snowflake, Role] = {r.id: r for r in roles}
 
     async def fetch_role(self, id: Id, *, cache: bool = False) -> Role:
         """|coro|
@@ -316,7 +317,7 @@ class Guild(BaseObject):
     @property
     def flags(self) -> GuildFlags:
         """GuildFlags: The flags of this guild."""
-        return GuildFlags(self._flags)
+        return self._flags
 
     @property
     def owner(self) -> Optional[Member]:
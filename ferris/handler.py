@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
-from typing import TYPE_CHECKING, Coroutine, Optional
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Optional
 
 from .channel import Channel
 from .guild import Guild
@@ -28,6 +29,13 @@ class _BaseEventHandler:
 
         self._heartbeat_manager: KeepAliveManager = heartbeat_manager
 
+        # Gateway events are dispatched to the coroutine method of the same name.
+        self._handlers: Dict[str, Callable[[dict], Coroutine[Any, Any, None]]] = {
+            name: method
+            for name, method in inspect.getmembers(self, inspect.iscoroutinefunction)
+            if name[0].isupper()
+        }
+
     def handle(self, _data: dict):
         if not _data:
             _data = {}
@@ -38,14 +46,16 @@ class _BaseEventHandler:
             return
 
         data = _data.get('d') or {}
-        log.debug(f"Handling event: {event} Data: {data}")
+        log.debug('Handling event: %s Data: %s', event, data)
 
         self.dispatch('socket_receive', event, data)
 
-        try:
-            asyncio.create_task(getattr(self, event)(data))
-        except AttributeError:
-            log.error(f'Received unkwown event: {event}')
+        handler = self._handlers.get(event)
+        if handler is None:
+            log.error('Received unkwown event: %s', event)
+            return
+
+        asyncio.create_task(handler(data))
 
 
 class EventHandler(_BaseEventHandler):
@@ -145,6 +155,9 @@ class EventHandler(_BaseEventHandler):
 
         self.connection.store_guild(g)
 
+        if user := self.connection.user:
+            user._add_guild(g)
+
         self.dispatch('guild_create', g)
 
     async def GuildUpdate(self, data):
@@ -155,12 +168,18 @@ class EventHandler(_BaseEventHandler):
             new = Guild(self.connection, data.get('new'))
             self.connection.store_guild(new)
 
+        if user := self.connection.user:
+            user._add_guild(new)
+
         self.dispatch('guild_update', old, new)
 
     async def GuildDelete(self, data):
         g = Guild(self.connection, data.get('guild'))
         self.connection._guilds.pop(g.id, None)
 
+        if user := self.connection.user:
+            user._remove_guild(g.id)
+
         self.dispatch('guild_delete', g)
 
     async def InviteCreate(self, data):
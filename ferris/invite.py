@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional, Union
 
 from ferris.utils import datetime_from_weird_format
@@ -45,7 +45,7 @@ class Invite:
         self._owner_id: Snowflake = data.get('owner_id')
         self._guild_id: Snowflake = data.get('guild_id')
 
-        self._created_at = datetime.fromtimestamp(data.get('created_at'))
+        self._created_at = datetime.fromtimestamp(data.get('created_at'), timezone.utc)
 
         self._uses: int = data.get('uses')
         self._max_uses: int = data.get('max_uses')
@@ -77,7 +77,7 @@ class Invite:
 
     @property
     def created_at(self) -> datetime:
-        """datetime: The time this invite was created."""
+        """datetime: The time this invite was created, as an aware UTC datetime."""
         return self._created_at
 
     @property
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 from .base import BaseObject
+from .errors import MalformedPayload
 
 from .utils import datetime_from_weird_format
 
@@ -41,12 +42,16 @@ class Message(BaseObject):
     def _process_data(self, data: Optional[MessagePayload], /) -> None:
         if not data:
             data: dict = {}
+            self._store_snowflake(None)
+        else:
+            try:
+                self._store_snowflake(data['id'])
+            except KeyError:
+                raise MalformedPayload('Message', 'id', data) from None
 
         from .user import User
         from .channel import Channel
 
-        self._store_snowflake(data.get('id'))
-
         self._content: Optional[str] = data.get('content')
 
         self._channel: Optional[Channel] = None
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import TYPE_CHECKING, Optional
 
 from .base import BaseObject
+from .errors import MalformedPayload
 
 
 if TYPE_CHECKING:
     from typing_extensions import Self
     from .connection import Connection
+    from .http import APIRouter
     from .types import Data, Snowflake
     from .types.role import RolePayload
     from .guild import Guild
@@ -15,27 +18,62 @@ if TYPE_CHECKING:
 
 __all__ = ("Role",)
 
+_ROLE_KEYS = ('id', 'guild_id', 'name', 'color', 'position', 'permissions')
+_role_fields = itemgetter(*_ROLE_KEYS)
+_NO_ROLE_FIELDS = (None,) * len(_ROLE_KEYS)
+
 
 class Role(BaseObject):
     """Represents a role object in FerrisChat."""
 
-    __all__ = ('_guild_id', '_name', '_color', '_position', '_permissions')
+    __slots__ = (
+        '_connection',
+        '_guild_id',
+        '_name',
+        '_color',
+        '_position',
+        '_permissions',
+        '_api_route',
+    )
 
     def __init__(self, connection: Connection, data: Optional[RolePayload], /) -> None:
         self._connection: Connection = connection
+        self._api_route: Optional[APIRouter] = None
         self._process_data(data)
 
     def _process_data(self, data: Optional[RolePayload], /) -> None:
         if not data:
-            data: dict = {}
-
-        self._store_snowflake(data.get('id'))
+            fields = _NO_ROLE_FIELDS
+        else:
+            try:
+                fields = _role_fields(data)
+            except KeyError:
+                if 'id' not in data:
+                    raise MalformedPayload('Role', 'id', data) from None
+                fields = map(data.get, _ROLE_KEYS)
+
+        id, guild_id, name, color, position, permissions = fields
+
+        if self._api_route is not None and (
+            id != self._id or guild_id != self._guild_id
+        ):
+            self._api_route = None
+
+        self._store_snowflake(id)
+
+        self._guild_id: Snowflake = guild_id
+        self._name: str = name
+        self._color: int = color
+        self._position: int = position
+        self._permissions: int = permissions
 
-        self._guild_id: Snowflake = data.get('guild_id')
-        self._name: str = data.get('name')
-        self._color: int = data.get('color')
-        self._position: int = data.get('position')
-        # TODO: self.permissions
+    @property
+    def _route(self) -> APIRouter:
+        route = self._api_route
+        if route is None:
+            guild = self._connection.api.guilds(self._guild_id)
+            route = self._api_route = guild.roles(self.id)
+        return route
 
     @property
     def guild(self) -> Optional[Guild]:
@@ -93,21 +131,22 @@ class Role(BaseObject):
         -------
         :class:`~Role`
         """
-        payload = {
-            'name': name,
-            'color': color,
-            'position': position,
-            'permissions': permissions,
-        }
-        r = (
-            await self._connection.api.guilds(self.guild_id)
-            .roles(self.id)
-            .patch(json=payload)
-        )
+        payload = {}
+
+        if name is not None:
+            payload['name'] = name
+        if color is not None:
+            payload['color'] = color
+        if position is not None:
+            payload['position'] = position
+        if permissions is not None:
+            payload['permissions'] = permissions
+
+        r = await self._route.patch(json=payload)
         self._process_data(r)
 
         return self
 
     async def delete(self) -> None:
         """Deletes the role."""
-        await self._connection.api.guilds(self.guild_id).roles(self.id).delete()
+        await self._route.delete()
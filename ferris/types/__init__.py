@@ -1,4 +1,4 @@
-from typing import Union
+from typing import TYPE_CHECKING
 
 from .auth import *
 from .base import *
@@ -10,11 +10,14 @@ from .role import *
 from .user import *
 from .ws import *
 
-Data = Union[
-    AuthResponse,
-    ChannelPayload,
-    GuildPayload,
-    MemberPayload,
-    MessagePayload,
-    UserPayload,
-]
+if TYPE_CHECKING:
+    from typing import Union
+
+    Data = Union[
+        AuthResponse,
+        ChannelPayload,
+        GuildPayload,
+        MemberPayload,
+        MessagePayload,
+        UserPayload,
+    ]
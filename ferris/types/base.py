@@ -1,4 +1,4 @@
-from typing import Protocol, Union, runtime_checkable, Optional
+from typing import Protocol, Union, Optional
 
 __all__ = ('SupportsStr', 'SupportsId', 'Id', 'Snowflake')
 
@@ -11,7 +11,6 @@ class SupportsStr(Protocol):
 Snowflake = int
 
 
-@runtime_checkable
 class SupportsId(Protocol):
     __slots__ = ()
 
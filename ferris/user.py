@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from .asset import Asset
 from .base import BaseObject
 from .bitflags import UserFlags
 from .enums import Pronouns
+from .errors import MalformedPayload
 from .guild import Guild
 from .types.base import Snowflake
 
@@ -18,6 +20,10 @@ if TYPE_CHECKING:
 
 __all__ = ('PartialUser', 'User', 'ClientUser')
 
+# Keys the server always sends; optional ones are read with dict.get.
+_USER_KEYS = ('id', 'name')
+_user_fields = itemgetter(*_USER_KEYS)
+
 
 class PartialUser(BaseObject):
     """
@@ -33,9 +39,18 @@ class PartialUser(BaseObject):
         if not data:
             return
 
-        self._store_snowflake(data.get('id'))
+        try:
+            fields = _user_fields(data)
+        except KeyError:
+            if 'id' not in data:
+                raise MalformedPayload('PartialUser', 'id', data) from None
+            fields = map(data.get, _USER_KEYS)
+
+        id, name = fields
+
+        self._store_snowflake(id)
 
-        self._name: Optional[str] = data.get('name')
+        self._name: Optional[str] = name
 
     @property
     def name(self) -> Optional[str]:
@@ -51,7 +66,15 @@ class User(BaseObject):
     Represents a FerrisChat user.
     """
 
-    __slots__ = ('_connection', '_name', '_avatar', '_flags', '_discrimator', '_is_bot')
+    __slots__ = (
+        '_connection',
+        '_name',
+        '_avatar',
+        '_flags',
+        '_raw_flags',
+        '_discrimator',
+        '_is_bot',
+    )
 
     def __init__(self, connection: Connection, data: UserPayload, /) -> None:
         self._connection: Connection = connection
@@ -60,10 +83,22 @@ class User(BaseObject):
     def _process_data(self, data: Optional[UserPayload], /) -> None:
         if not data:
             data: dict = {}
+            fields = (None, None)
+        else:
+            try:
+                fields = _user_fields(data)
+            except KeyError:
+                if 'id' not in data:
+                    raise MalformedPayload(
+                        self.__class__.__name__, 'id', data
+                    ) from None
+                fields = map(data.get, _USER_KEYS)
+
+        id, name = fields
 
-        self._store_snowflake(data.get('id'))
+        self._store_snowflake(id)
 
-        self._name: Optional[str] = data.get('name')
+        self._name: Optional[str] = name
 
         if avatar := data.get('avatar'):
             self._avatar: Optional[Asset] = Asset(self._connection, avatar)
@@ -74,7 +109,9 @@ class User(BaseObject):
 
         self._is_bot: bool = data.get('is_bot')
 
-        self._flags: UserFlags = UserFlags(data.get('flags') or 0)
+        # UserFlags is built on first access to User.flags.
+        self._raw_flags: int = data.get('flags') or 0
+        self._flags: Optional[UserFlags] = None
 
     @property
     def name(self, /) -> Optional[str]:
@@ -99,38 +136,58 @@ class User(BaseObject):
     @property
     def flags(self) -> UserFlags:
         """UserFlags: The flags of this user."""
-        return self._flags
+        flags = self._flags
+        if flags is None:
+            flags = self._flags = UserFlags(self._raw_flags)
+        return flags
     
     def __str__(self) -> str:
         return f'{self.name}#{self.discrimator}'
 
-    def __del__(self, /) -> None:
-        if not hasattr(self, '_connection'):
-            return
-
-        self._connection.deref_user(self.id)
-
     def __repr__(self, /) -> str:
         return f'<User id={self.id} name={self.name!r}>'
 
 
 class ClientUser(User):
+    __slots__ = ('_guilds', '_guilds_view')
+
     def __init__(self, connection: Connection, data: UserPayload, /) -> None:
         super().__init__(connection, data)
 
         self._guilds: Dict[Snowflake, Guild] = {}
 
-        for g in data.get('guilds') or []:
+        guilds = self._guilds
+        cached = self._connection._guilds
+
+        for g in data.get('guilds') or ():
             guild_id = g.get('id')
 
-            if guild_id in self._connection._guilds:
-                guild = self._connection.get_guild(guild_id)
+            if (guild := cached.get(guild_id)) is not None:
                 guild._process_data(g)
-
-            if guild_id not in self._guilds:
+            else:
                 guild = Guild(self._connection, g)
                 self._connection.store_guild(guild)
 
+            guilds[guild_id] = guild
+
+        self._guilds_view: Tuple[Guild, ...] = tuple(self._guilds.values())
+
+    def _add_guild(self, guild: Guild, /) -> None:
+        if self._guilds.get(guild.id) is guild:
+            return
+
+        self._guilds[guild.id] = guild
+        self._guilds_view = tuple(self._guilds.values())
+
+    def _remove_guild(self, id: Snowflake, /) -> None:
+        if self._guilds.pop(id, None) is not None:
+            self._guilds_view = tuple(self._guilds.values())
+
+    @property
+    def guilds(self, /) -> Tuple[Guild, ...]:
+        """Tuple[:class:`~.Guild`]: The guilds this user is in."""
+        return self._guilds_view
+
     async def edit(
         self,
         username: Optional[str] = None,
@@ -161,13 +218,19 @@ class ClientUser(User):
         User
             The edited :class:`~ClientUser`.
         """
-        payload = {
-            'username': username,
-            'email': email,
-            'password': password,
-            'avatar': avatar,
-            'pronouns': pronouns.value if pronouns else None,
-        }
+        payload = {}
+
+        if username is not None:
+            payload['username'] = username
+        if email is not None:
+            payload['email'] = email
+        if password is not None:
+            payload['password'] = password
+        if avatar is not None:
+            payload['avatar'] = avatar
+        if pronouns is not None:
+            payload['pronouns'] = pronouns.value
+
         user = await self._connection.api.users.me.patch(json=payload)
         self._process_data(user)
         return self
@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import functools
 import inspect
+import json
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -13,6 +14,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Set,
     TypeVar,
     Union,
     overload,
@@ -44,41 +46,26 @@ __all__ = (
 )
 
 
-try:
-    import orjson
-
-    HAS_ORJSON = True
-except ImportError:
-    import json
-
-
-import json
-
-HAS_ORJSON = False
-
 FERRIS_EPOCH_MS: int = 1_640_995_200_000
 
-
-FERRIS_EPOCH: int = 1_640_995_200
+_FERRIS_EPOCH_DT: datetime = datetime.fromtimestamp(
+    FERRIS_EPOCH_MS / 1000, timezone.utc
+)
+_ONE_MS: timedelta = timedelta(milliseconds=1)
 
 PY_3_8: bool = sys.version_info < (3, 9)
 
 
-# if HAS_ORJSON:
-
-#     def to_json(obj: Any) -> str:
-#         return orjson.dumps(obj).decode('utf-8')
+# FerrisChat snowflakes are 128-bit integers. orjson only supports
+# 64-bit integers: it refuses to encode them and decodes them as floats,
+# which silently corrupts every ID, so the stdlib codec is used.
 
-#     def from_json(json_str: str) -> Any:
-#         if not json_str:
-#             return None
-        
-#         return orjson.loads(json_str)
+# A shared encoder: json.dumps builds a new one per call for non-default options.
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
 
-# else:
 
 def to_json(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=True)
+    return _encoder.encode(obj)
 
 def from_json(json_str: str) -> Any:
     if not json_str:
@@ -99,7 +86,10 @@ def sanitize_id(id: Id = None) -> Snowflake:
     Snowflake
         The sanitized ID.
     """
-    return getattr(id, 'id', id) if id else None
+    if id is None or type(id) is int:
+        return id
+
+    return getattr(id, 'id', id)
 
 
 def get_snowflake_creation_date(snowflake: int) -> datetime:
@@ -113,10 +103,10 @@ def get_snowflake_creation_date(snowflake: int) -> datetime:
     Returns
     -------
     :class:`datetime.datetime`
-        The creation date of the snowflake.
+        The creation date of the snowflake, as an aware UTC datetime.
     """
     seconds = ((snowflake >> 64) + FERRIS_EPOCH_MS) / 1000
-    return datetime.utcfromtimestamp(seconds)
+    return datetime.fromtimestamp(seconds, timezone.utc)
 
 
 def dt_to_snowflake(dt: datetime) -> int:
@@ -132,8 +122,11 @@ def dt_to_snowflake(dt: datetime) -> int:
     int
         The generated snowflake.
     """
-    timestamp = dt.timestamp() * 1000 - FERRIS_EPOCH_MS
-    return int(timestamp) << 64
+    if dt.tzinfo is None:
+        # Naive datetimes are in local time, as with datetime.timestamp().
+        dt = dt.astimezone()
+
+    return ((dt - _FERRIS_EPOCH_DT) // _ONE_MS) << 64
 
 
 def find(predicate: Callable[[T], Any], iterable: Iterable[T]) -> Optional[T]:
@@ -153,10 +146,7 @@ def find(predicate: Callable[[T], Any], iterable: Iterable[T]) -> Optional[T]:
         Can be None if no element satisfies the predicate.
 
     """
-    for element in iterable:
-        if predicate(element):
-            return element
-    return None
+    return next(filter(predicate, iterable), None)
 
 
 def pending(f: PT) -> PT:
@@ -184,6 +174,8 @@ def ensure_async(func: Union[A, F], /) -> A:
     In other terms, if the function is already async, it will stay the same.
     Else, it will be converted into an async function. (Note that it will still be ran synchronously.)
     """
+    if inspect.iscoroutinefunction(func):
+        return func
 
     @functools.wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
@@ -197,13 +189,36 @@ def ensure_async(func: Union[A, F], /) -> A:
     return wrapper
 
 
-async def _call_later(seconds: int, func: Union[A, F]) -> None:
-    await asyncio.sleep(seconds)
-    await ensure_async(func)()
+# Strong references to tasks started by call_later, so they are not collected mid-run.
+_call_later_tasks: Set[asyncio.Task] = set()
+
 
+def _track(task: asyncio.Task, /) -> None:
+    _call_later_tasks.add(task)
+    task.add_done_callback(_call_later_tasks.discard)
 
-def call_later(seconds: int, func: Union[A, F]) -> asyncio.Task:
-    return asyncio.create_task(_call_later(seconds, func))
+
+def call_later(seconds: int, func: Union[A, F]) -> asyncio.TimerHandle:
+    """Schedules the given function to be called after the given amount of seconds.
+    Once the delay has passed, the function is ran as a task through
+    :func:`ensure_async`, so awaitables returned by synchronous functions are awaited.
+
+    Parameters
+    ----------
+    seconds: int
+        The amount of seconds to wait before calling the function.
+    func: Callable[[], Any]
+        The function to call.
+
+    Returns
+    -------
+    :class:`asyncio.TimerHandle`
+        The handle for the scheduled call, which can be used to cancel it.
+    """
+    loop = asyncio.get_running_loop()
+    func = ensure_async(func)
+
+    return loop.call_later(seconds, lambda: _track(loop.create_task(func())))
 
 
 def datetime_from_weird_format(weird_format: List[int, int, int, int]) -> datetime:
@@ -217,23 +232,13 @@ def datetime_from_weird_format(weird_format: List[int, int, int, int]) -> dateti
     Returns
     -------
     datetime.datetime
-        The datetime object.
+        The datetime object, as an aware UTC datetime.
     """
     # Thanks whoever made this format
+    # [year, day of the year, seconds into the day, nanoseconds]
 
-    d = datetime.fromordinal(weird_format[1])
+    year, day, seconds, nanoseconds = weird_format
 
-    seconds = weird_format[2]
-
-    hours, seconds = divmod(seconds, 3600)
-    minutes, seconds = divmod(seconds, 60)
-
-    d.replace(
-        year=weird_format[0],
-        hour=hours,
-        minute=minutes,
-        second=seconds,
-        microsecond=weird_format[3] // 1000,
+    return datetime(year, 1, 1, tzinfo=timezone.utc) + timedelta(
+        days=day - 1, seconds=seconds, microseconds=nanoseconds // 1000
     )
-
-    return d
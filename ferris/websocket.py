@@ -8,7 +8,7 @@ import threading
 import time
 import traceback
 from types import coroutine
-from typing import TYPE_CHECKING, Coroutine, Dict, Union, Any
+from typing import TYPE_CHECKING, Any, ClassVar, Coroutine, Dict
 
 import aiohttp
 
@@ -25,6 +25,11 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+_DATA_MSG_TYPES = frozenset((aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY))
+_CLOSE_MSG_TYPES = frozenset(
+    (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSE)
+)
+
 
 class KeepAliveManager(threading.Thread):
     def __init__(self, ws: Websocket, /) -> None:
@@ -35,16 +40,20 @@ class KeepAliveManager(threading.Thread):
 
         self._max_heartbeat_timeout: int = ws._max_heartbeat_timeout
 
-        self._last_ack: float = time.perf_counter()
-        self._last_send: float = time.perf_counter()
-        self._last_recv: float = time.perf_counter()
+        # Timestamps are integer nanoseconds from time.monotonic_ns().
+        now = time.monotonic_ns()
+        self._last_ack: int = now
+        self._last_send: int = now
+        self._last_recv: int = now
         self._latency: float = float('inf')
 
         super().__init__(name="FerrisWheel-KeepAliveManager", daemon=True)
 
     def run(self) -> None:
+        timeout_ns = self._max_heartbeat_timeout * 1_000_000_000
+
         while not self._stop_event.wait(self._interval):
-            if self._last_recv + self._max_heartbeat_timeout < time.perf_counter():
+            if time.monotonic_ns() - self._last_recv > timeout_ns:
                 log.warning('Websocket stopped responding to gateway. Reconnecting.')
                 coro = self._ws.close(4000)
                 f = asyncio.run_coroutine_threadsafe(coro, self._ws._loop)
@@ -82,25 +91,25 @@ class KeepAliveManager(threading.Thread):
                 self.stop()
                 return
             else:
-                self._last_send = time.perf_counter()
+                self._last_send = time.monotonic_ns()
 
     def ping(self) -> asyncio.Future:
-        coro = self._ws.send(self.ping_payload)
+        coro = self._ws.send_op('Ping')
         return asyncio.run_coroutine_threadsafe(coro, self._ws._loop)
 
     def pong(self) -> asyncio.Future:
-        coro = self._ws.send(self.pong_payload)
+        coro = self._ws.send_op('Pong')
         return asyncio.run_coroutine_threadsafe(coro, self._ws._loop)
 
     def stop(self) -> None:
         self._stop_event.set()
 
     def tick(self) -> None:
-        self._last_recv = time.perf_counter()
+        self._last_recv = time.monotonic_ns()
 
     def ack(self) -> None:
-        self._last_ack = time.perf_counter()
-        self._latency = self._last_ack - self._last_send
+        self._last_ack = time.monotonic_ns()
+        self._latency = (self._last_ack - self._last_send) / 1e9
 
         if self._latency > 10:
             log.warning(f'Websocket is {self._latency:.1f} seconds behind.')
@@ -117,20 +126,15 @@ class KeepAliveManager(threading.Thread):
         """Returns the message to be logged when heartbeat is blocked."""
         return 'Websocket heartbeat blocked for more than %s seconds'
 
-    @property
-    def ping_payload(self) -> Dict[str, str]:
-        """Returns the ping payload to be sent to the websocket."""
-        return {'c': 'Ping'}
-
-    @property
-    def pong_payload(self) -> Dict[str, str]:
-        """Returns the pong payload to be sent to the websocket."""
-        return {'c': 'Pong'}
-
 
 class Websocket:
     """The class that interfaces with FerrisChat's websockets."""
 
+    # Serialized frames for gateway operations that carry no data.
+    _OP_FRAMES: ClassVar[Dict[str, str]] = {
+        op: to_json({'c': op}) for op in ('Ping', 'Pong')
+    }
+
     def __init__(self, client: Client) -> None:
         self.ws: aiohttp.ClientWebSocketResponse
         self._http: HTTPClient = client._connection._http
@@ -146,23 +150,27 @@ class Websocket:
         self.dispatch: Coroutine = client.dispatch
         self._ws_url: str = ''
 
+        self._identify_frame: str = to_json(
+            {'c': 'Identify', 'd': {'token': self._http.token, 'intents': 0}}
+        )
+
     async def prepare(self) -> None:
         """Retrieves the URL needed for websocket connection."""
         response: WsConnectionInfo = await self._http.api.ws.info.get()  # type: ignore
         self._ws_url = response['url']
 
-    def _parse_and_handle(self, data: Union[str, bytes], /) -> None:
-        """Handles a message received from the websocket."""
-        self._heartbeat_manager.tick()
-
-        if isinstance(data, (str, bytes)):
-            _data: dict = from_json(data)
-            self._handler.handle(_data or {})
-
     async def send(self, data: Dict[Any, Any], /) -> None:
         _data = to_json(data)
         await self.ws.send_str(_data)
 
+    async def send_raw(self, data: str, /) -> None:
+        """Sends an already serialized payload to the websocket."""
+        await self.ws.send_str(data)
+
+    async def send_op(self, op: str, /) -> None:
+        """Sends a gateway operation that carries no data, such as ``Ping``."""
+        await self.ws.send_str(self._OP_FRAMES[op])
+
     async def connect(self) -> None:
         """Establishes a websocket connection with FerrisChat."""
         if not self._ws_url:
@@ -170,25 +178,25 @@ class Websocket:
 
         self.ws = await self._http.session.ws_connect(self._ws_url)
 
-        await self.send(
-            {'c': 'Identify', 'd': {'token': self._http.token, 'intents': 0}}
-        )
+        await self.send_raw(self._identify_frame)
 
         if not self._heartbeat_manager.is_alive():
             self._heartbeat_manager.start()
 
         self.dispatch('connect')
 
-        VALID_WS_EVENTS = {aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY}
-        INVALID_WS_EVENTS = {aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSE}
+        # This loop runs once per frame, so resolve these only once.
+        tick = self._heartbeat_manager.tick
+        handle = self._handler.handle
 
         async for message in self.ws:
-            if message.type in VALID_WS_EVENTS:
-                self._parse_and_handle(message.data)
+            if message.type in _DATA_MSG_TYPES:
+                tick()
+                handle(from_json(message.data) or {})
             elif message.type is aiohttp.WSMsgType.ERROR:
                 log.error(f'Websocket error: {message.data}')
                 raise WebsocketException(message.data)
-            elif message.type in INVALID_WS_EVENTS:
+            elif message.type in _CLOSE_MSG_TYPES:
                 log.info('Websocket closed, attempting to reconnect.')
                 self._heartbeat_manager.stop()
                 raise Reconnect
@@ -1,28 +1,49 @@
 import pathlib
-import re
 
 from setuptools import setup
 
 ROOT = pathlib.Path(__file__).parent
 
+PYTHON_REQUIRES = '>=3.8.0'
+
+CLASSIFIERS = (
+    'Development Status :: 4 - Beta',
+    'Intended Audience :: Developers',
+    'License :: OSI Approved :: MIT License',
+    'Natural Language :: English',
+    'Operating System :: OS Independent',
+    'Programming Language :: Python :: 3.8',
+    'Programming Language :: Python :: 3.9',
+    'Programming Language :: Python :: 3.10',
+    'Topic :: Internet',
+    'Topic :: Software Development :: Libraries',
+    'Topic :: Software Development :: Libraries :: Python Modules',
+    'Topic :: Utilities',
+    'Typing :: Typed',
+)
+
+version = None
+author = None
+
+# Both dunders sit at the top of the file, so stop reading once they are found.
 with open('ferris/__init__.py', 'r') as f:
-    content = f.read()
-    try:
-        version = re.search(r'^__version__\s*=\s*[\'"]([^\'"]*)[\'"]', content, re.MULTILINE).group(1)  # type: ignore
-    except AttributeError:
-        raise RuntimeError('Unable to find version string')
+    for line in f:
+        if line.startswith('__version__'):
+            version = line.split('=', 1)[1].strip().strip('\'"')
+        elif line.startswith('__author__'):
+            author = line.split('=', 1)[1].strip().strip('\'"')
 
-    try:
-        author = re.search(r'^__author__\s*=\s*[\'"]([^\'"]*)[\'"]', content, re.MULTILINE).group(1)  # type: ignore
-    except AttributeError:
-        author = 'Cryptex & jay3332'
+        if version is not None and author is not None:
+            break
 
+if version is None:
+    raise RuntimeError('Unable to find version string')
 
-with open(ROOT / 'README.md', encoding='utf-8') as f:
-    readme = f.read()
+if author is None:
+    author = 'Cryptex & jay3332'
 
-with open(ROOT / 'requirements.txt', encoding='utf-8') as f:
-    requirements = f.readlines()
+readme = (ROOT / 'README.md').read_text(encoding='utf-8')
+requirements = (ROOT / 'requirements.txt').read_text(encoding='utf-8').splitlines()
 
 setup(
     name="ferriswheel",
@@ -37,7 +58,7 @@ setup(
     description="An asynchronous Python wrapper around FerrisChat's API",
     long_description=readme,
     long_description_content_type="text/markdown",
-    include_package_data=True,
+    package_data={"ferris": ["py.typed"]},
     install_requires=requirements,
     extras_require={
         "docs": [
@@ -46,22 +67,11 @@ setup(
             'sphinx-copybutton',
             'readthedocs-sphinx-search',
         ],
-        "performance": ["aiohttp[speedups]"],
+        "performance": [
+            "aiohttp[speedups]",
+            "uvloop; platform_system != 'Windows'",
+        ],
     },
-    python_requires=">=3.8.0",
-    classifiers=[
-        'Development Status :: 4 - Beta',
-        'License :: OSI Approved :: MIT License',
-        'Intended Audience :: Developers',
-        'Natural Language :: English',
-        'Operating System :: OS Independent',
-        'Programming Language :: Python :: 3.8',
-        'Programming Language :: Python :: 3.9',
-        'Programming Language :: Python :: 3.10',
-        'Topic :: Internet',
-        'Topic :: Software Development :: Libraries',
-        'Topic :: Software Development :: Libraries :: Python Modules',
-        'Topic :: Utilities',
-        'Typing :: Typed',
-    ],
+    python_requires=PYTHON_REQUIRES,
+    classifiers=CLASSIFIERS,
 )
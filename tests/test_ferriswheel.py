@@ -1,14 +1,10 @@
-import os
+import asyncio
 import logging
 
 import ferris
 
 log = logging.getLogger(__name__)
 
-_log = logging.getLogger()
-_log.addHandler(logging.StreamHandler())
-_log.setLevel(logging.DEBUG)
-
 
 class Client(ferris.Client):
     async def on_ready(self):
@@ -16,15 +12,11 @@ class Client(ferris.Client):
             log.info("Starting test.")
 
             g = await self.create_guild(name='test')
-
-            g = await self.fetch_guild(g.id)
             log.info(repr(g))
             await g.edit(name='test_edit')
-            log.info("Create and Fetch and edit guild works.")
+            log.info("Create and edit guild works.")
 
             c = await g.create_channel(name='test')
-
-            c = await self.fetch_channel(c.id)
             log.info(repr(c))
             await c.edit(name='test_edit')
 
@@ -32,15 +24,22 @@ class Client(ferris.Client):
             log.info(repr(m))
             await m.edit(content='test_edit')
 
-            log.info("Create, Fetch, Edit channel, send, edit message works.")
+            log.info("Create, Edit channel, send, edit message works.")
+
+            fg, fc, u, i = await asyncio.gather(
+                self.fetch_guild(g.id),
+                self.fetch_channel(c.id),
+                self.fetch_self(),
+                g.create_invite(),
+            )
+            log.info(repr(fg))
+            log.info(repr(fc))
+            log.info("Fetch guild, channel works.")
 
-            u = await self.fetch_self()
             log.info(repr(u))
             log.info("Fetch user works.")
 
-            i = await g.create_invite()
             log.info(repr(i))
-
             log.info("Create invite works.")
 
             await m.delete()
@@ -54,6 +53,21 @@ class Client(ferris.Client):
             await self.close()
 
 
-client = Client()
+if __name__ == '__main__':
+    import os
+
+    _log = logging.getLogger()
+    _log.addHandler(logging.StreamHandler())
+    _log.setLevel(logging.DEBUG)
+
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        # Client() grabs the event loop when built, so set the policy first.
+        uvloop.install()
+
+    client = Client()
 
-client.run(token=os.getenv('TOKEN'))
+    client.run(token=os.getenv('TOKEN'))
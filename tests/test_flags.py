@@ -0,0 +1,29 @@
+import ferris
+
+
+class _Connection:
+    def get_channel(self, id):
+        return None
+
+    def store_channel(self, channel):
+        pass
+
+
+def test_user_flags_are_cached_and_mutable():
+    user = ferris.User(_Connection(), {'id': 1, 'name': 'ferris', 'flags': 1})
+
+    assert user.flags is user.flags
+    assert user.flags.bot_account
+
+    user.flags.possible_scam = True
+    assert user.flags.possible_scam
+
+    user._process_data({'id': 1, 'name': 'ferris'})
+    assert not user.flags.bot_account
+
+
+def test_guild_flags():
+    guild = ferris.Guild(_Connection(), {'id': 1, 'flags': 1})
+
+    assert isinstance(guild.flags, ferris.GuildFlags)
+    assert guild.flags.verified_guild
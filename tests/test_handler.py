@@ -0,0 +1,57 @@
+import asyncio
+
+from ferris.connection import Connection
+from ferris.guild import Guild
+from ferris.handler import EventHandler
+from ferris.user import ClientUser
+
+
+def _guild_ids(connection):
+    return [g.id for g in connection.user.guilds]
+
+
+def test_guild_events_update_client_user_guilds():
+    async def main():
+        dispatched = []
+        connection = Connection(
+            asyncio.get_running_loop(), lambda *args: dispatched.append(args)
+        )
+        connection._user = ClientUser(connection, {'id': 1, 'guilds': []})
+        handler = EventHandler(connection, None)
+
+        await handler.GuildCreate({'guild': {'id': 2, 'name': 'a'}})
+        assert _guild_ids(connection) == [2]
+
+        await handler.GuildUpdate(
+            {'old': {'id': 3, 'name': 'b'}, 'new': {'id': 3, 'name': 'c'}}
+        )
+        assert _guild_ids(connection) == [2, 3]
+        assert connection.get_guild(3).name == 'c'
+
+        await handler.GuildUpdate(
+            {'old': {'id': 2, 'name': 'a'}, 'new': {'id': 2, 'name': 'd'}}
+        )
+        assert _guild_ids(connection) == [2, 3]
+        assert connection.user.guilds[0].name == 'd'
+
+        # Cached on the connection (e.g. through fetch_guild) but not on the user.
+        connection.store_guild(Guild(connection, {'id': 4, 'name': 'e'}))
+        await handler.GuildUpdate(
+            {'old': {'id': 4, 'name': 'e'}, 'new': {'id': 4, 'name': 'f'}}
+        )
+        assert _guild_ids(connection) == [2, 3, 4]
+        assert connection.user.guilds[2].name == 'f'
+
+        await handler.GuildDelete({'guild': {'id': 2}})
+        assert _guild_ids(connection) == [3, 4]
+        assert connection.get_guild(2) is None
+
+        assert [event for event, *_ in dispatched] == [
+            'guild_create',
+            'guild_update',
+            'guild_update',
+            'guild_update',
+            'guild_delete',
+        ]
+
+    asyncio.run(main())
@@ -0,0 +1,31 @@
+import pytest
+
+import ferris
+
+
+class _Connection:
+    def __init__(self):
+        self._guilds = {}
+
+    def get_channel(self, id):
+        return None
+
+    def store_channel(self, channel):
+        pass
+
+    def store_guild(self, guild):
+        self._guilds[guild.id] = guild
+
+
+@pytest.mark.parametrize(
+    'obj',
+    [
+        lambda: ferris.PartialUser({'id': 1, 'name': 'ferris'}),
+        lambda: ferris.User(_Connection(), {'id': 1, 'name': 'ferris'}),
+        lambda: ferris.ClientUser(_Connection(), {'id': 1, 'guilds': [{'id': 2}]}),
+        lambda: ferris.Role(_Connection(), {'id': 1, 'guild_id': 2}),
+    ],
+    ids=['PartialUser', 'User', 'ClientUser', 'Role'],
+)
+def test_no_instance_dict(obj):
+    assert not hasattr(obj(), '__dict__')
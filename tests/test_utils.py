@@ -0,0 +1,35 @@
+import asyncio
+import warnings
+from datetime import datetime, timezone
+
+from ferris.utils import (
+    call_later,
+    datetime_from_weird_format,
+    get_snowflake_creation_date,
+)
+
+
+def test_call_later_awaits_returned_coroutine():
+    ran = []
+
+    async def coro():
+        ran.append(True)
+
+    async def main():
+        call_later(0.01, lambda: coro())
+        await asyncio.sleep(0.05)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        asyncio.run(main())
+
+    assert ran == [True]
+
+
+def test_datetimes_are_aware_utc():
+    edited_at = datetime_from_weird_format([2022, 45, 3661, 500_000_000])
+    created_at = get_snowflake_creation_date(1 << 64)
+
+    assert edited_at == datetime(2022, 2, 14, 1, 1, 1, 500_000, tzinfo=timezone.utc)
+    assert created_at.tzinfo is timezone.utc
+    assert edited_at - created_at